@@ -1,32 +1,70 @@
 import re
-from typing import List
+from typing import Optional
+
+
+_NORM_PUNCT = re.compile(r"[^\w\s]")
+_NORM_WS = re.compile(r"\s+")
 
 
 def normalize(text: str) -> str:
     text = text.lower()
-    text = re.sub(r"[^\w\s]", "", text)
-    return re.sub(r"\s+", " ", text).strip()
+    text = _NORM_PUNCT.sub("", text)
+    return _NORM_WS.sub(" ", text).strip()
+
+
+# Keyed on the first three characters; the full prefix is then confirmed so that
+# e.g. "where"/"whether" don't count as "when" while "whose"/"whom" still count as "who"
+_QTYPE_BY_PREFIX = {
+    "who": ("who", "PERSON_OR_TEAM"),
+    "whi": ("which", "ENTITY"),
+    "whe": ("when", "DATE"),
+    "why": ("why", "REASON"),
+}
 
 
 def detect_question_type(question: str) -> str:
     q = question.lower().strip()
-    if q.startswith("who"):
-        return "PERSON_OR_TEAM"
-    if q.startswith("which"):
-        return "ENTITY"
-    if q.startswith("when"):
-        return "DATE"
-    if q.startswith("why"):
-        return "REASON"
+    entry = _QTYPE_BY_PREFIX.get(q[:3])
+    if entry is not None and q.startswith(entry[0]):
+        return entry[1]
     return "FACT"
 
 
-MONTH_RE = r"(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\.?\s+\d{1,2},\s*\d{4}"
-
-
-def _extract_proper_nouns(sentence: str) -> List[str]:
-    # Captures capitalized phrases, including simple multi-word entities
-    return re.findall(r"\b[A-Z][a-z]+(?:\s[A-Z][a-z]+)*\b", sentence)
+# Month names factored on their shared abbreviation prefix, so each prefix is scanned once
+MONTH_RE = (
+    r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?"
+    r"|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\.?\s+\d{1,2},\s*\d{4}"
+)
+
+_MONTH_RE = re.compile(MONTH_RE)
+_PROPER_NOUN_RE = re.compile(r"\b[A-Z][a-z]+(?:\s[A-Z][a-z]+)*\b")
+_HOSTED_RE = re.compile(r"\b(co-?hosted|hosted)\b", flags=re.IGNORECASE)
+_CO_HOSTED_BY_RE = re.compile(r"co-?hosted\s+by\s+([A-Z][^.,]*?)\s*(?:,| from| starting|\.|$)")
+_HOSTED_BY_RE = re.compile(r"hosted\s+by\s+([A-Z][^.,]*?)\s*(?:,| from| starting|\.|$)")
+_REPLACED_BY_RE = re.compile(r"replaced\s+by\s+([A-Z][A-Za-z]*(?:\s[A-Z][A-Za-z]*)*)")
+_NAME_BEFORE_ROLE_RE = re.compile(
+    r"\b([A-Z][A-Za-z]*(?:\s[A-Z][A-Za-z]*)*)\b[^.]*\b(?:appointed|named|as)\b[^.]*\b(?:captain|coach|skipper)\b"
+)
+_ROLE_BEFORE_NAME_RE = re.compile(r"\b(?:captain|coach|skipper)\b[^.]*?\b([A-Z][A-Za-z]*(?:\s[A-Z][A-Za-z]*)*)\b")
+_CAUSAL_CUE_RE = re.compile(r"\b(because|due to|following|as a result)\b", flags=re.IGNORECASE)
+_DUE_TO_RE = re.compile(r"due to\s+(.*?)(?:\.|$)", flags=re.IGNORECASE)
+
+
+def _longest_proper_noun(sentence: str) -> Optional[str]:
+    # Captures capitalized phrases, including simple multi-word entities, in one pass.
+    # Prefers the longest multi-token entity, else the longest single token (first wins on ties).
+    best_multi = None
+    best_any = None
+    for m in _PROPER_NOUN_RE.finditer(sentence):
+        ent = m.group(0)
+        if ' ' in ent:
+            if best_multi is None or len(ent) > len(best_multi):
+                best_multi = ent
+                if len(ent) == len(sentence):
+                    break
+        elif best_multi is None and (best_any is None or len(ent) > len(best_any)):
+            best_any = ent
+    return best_multi or best_any
 
 
 def extract_short_answer(sentence: str, qtype: str, question: str = "") -> str:
@@ -36,17 +74,17 @@ def extract_short_answer(sentence: str, qtype: str, question: str = "") -> str:
     # Special combined host+date extraction if both are asked (Prioritize this)
     if ("host" in q) and ("when" in q or "start" in q):
         # Prefer the full sentence when both cues are present for EM alignment
-        if re.search(r"\b(co-?hosted|hosted)\b", s, flags=re.IGNORECASE) and re.search(MONTH_RE, s):
+        if _HOSTED_RE.search(s) and _MONTH_RE.search(s):
             return s if s.endswith('.') else s + '.'
         # Fallback assembly if pieces are split
         host = None
         date = None
-        m_host = re.search(r"co-?hosted\s+by\s+([A-Z][^.,]*?)\s*(?:,| from| starting|\.|$)", s)
+        m_host = _CO_HOSTED_BY_RE.search(s)
         if not m_host:
-            m_host = re.search(r"hosted\s+by\s+([A-Z][^.,]*?)\s*(?:,| from| starting|\.|$)", s)
+            m_host = _HOSTED_BY_RE.search(s)
         if m_host:
             host = m_host.group(1).strip()
-        m_date = re.search(MONTH_RE, s)
+        m_date = _MONTH_RE.search(s)
         if m_date:
             date = m_date.group(0).strip()
         if host and date:
@@ -59,38 +97,35 @@ def extract_short_answer(sentence: str, qtype: str, question: str = "") -> str:
 
     if qtype in {"PERSON_OR_TEAM", "ENTITY"}:
         # High-precision pattern for replacement/team questions
-        m = re.search(r"replaced\s+by\s+([A-Z][A-Za-z]*(?:\s[A-Z][A-Za-z]*)*)", s)
+        m = _REPLACED_BY_RE.search(s)
         if m:
             ans = m.group(1).strip()
             return ans if ans.endswith('.') else ans
 
         # Name before role (e.g., "Sophie Molineux has been appointed ... captain")
         # CHECK THIS BEFORE "captain ... [NAME]" to avoid matching "Australian" in "captain of the Australian..."
-        m = re.search(r"\b([A-Z][A-Za-z]*(?:\s[A-Z][A-Za-z]*)*)\b[^.]*\b(?:appointed|named|as)\b[^.]*\b(?:captain|coach|skipper)\b", s)
+        m = _NAME_BEFORE_ROLE_RE.search(s)
         if m:
             ans = m.group(1).strip()
             return ans if ans.endswith('.') else ans
 
         # Roles like captain/coach/host
-        m = re.search(r"\b(?:captain|coach|skipper)\b[^.]*?\b([A-Z][A-Za-z]*(?:\s[A-Z][A-Za-z]*)*)\b", s)
+        m = _ROLE_BEFORE_NAME_RE.search(s)
         if m:
             ans = m.group(1).strip()
             return ans if ans.endswith('.') else ans
 
-        ents = _extract_proper_nouns(s)
-        if ents:
-            # Prefer multi-token entities, else fall back to longest
-            multi = [e for e in ents if ' ' in e]
-            ans = max(multi or ents, key=len)
+        ans = _longest_proper_noun(s)
+        if ans:
             return ans if ans.endswith('.') else ans
         return s
 
     if qtype == "REASON":
         # For EM-style evaluation, prefer the full causal sentence if it contains causal cues
-        if re.search(r"\b(because|due to|following|as a result)\b", s, flags=re.IGNORECASE):
+        if _CAUSAL_CUE_RE.search(s):
             return s if s.endswith('.') else s + '.'
         # Otherwise return a reconstructed causal phrase if possible
-        m = re.search(r"due to\s+(.*?)(?:\.|$)", s, flags=re.IGNORECASE)
+        m = _DUE_TO_RE.search(s)
         if m:
             phrase = m.group(1).strip()
             ans = f"Because {phrase}"
@@ -98,7 +133,7 @@ def extract_short_answer(sentence: str, qtype: str, question: str = "") -> str:
         return s if s.endswith('.') else s + '.'
 
     if qtype == "DATE":
-        m = re.search(MONTH_RE, s)
+        m = _MONTH_RE.search(s)
         if m:
             return m.group(0)
         return s
@@ -51,6 +51,10 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Simple stopword removal for keyword coverage
+STOPWORDS = frozenset({"is", "the", "in", "at", "which", "who", "what", "where", "when", "does", "that", "and", "or", "to", "of", "a", "an"})
+_TOKEN_RE = re.compile(r"\w+")
+
 def dynamic_analysis(query, answer, retrieved_chunks):
     insights = []
     
@@ -64,14 +68,12 @@ def dynamic_analysis(query, answer, retrieved_chunks):
     elif top_score > 0.7:
         insights.append(f"✅ **Strong Retrieval Signal:** Top match score is high ({top_score:.2f}).")
 
-    # 2. Key Term Coverage
-    # Simple stopword removal
-    stopwords = {"is", "the", "in", "at", "which", "who", "what", "where", "when", "does", "that", "and", "or", "to", "of", "a", "an"}
-    query_terms = set(re.findall(r"\w+", query.lower())) - stopwords
+    # 2. Key Term Coverage (whole-token match against the top chunk)
+    query_terms = set(_TOKEN_RE.findall(query.lower())) - STOPWORDS
     
     if query_terms:
-        top_chunk_text = retrieved_chunks[0][0].text.lower()
-        found_terms = {t for t in query_terms if t in top_chunk_text}
+        top_chunk_tokens = set(_TOKEN_RE.findall(retrieved_chunks[0][0].text.lower()))
+        found_terms = query_terms & top_chunk_tokens
         missing_terms = query_terms - found_terms
         coverage_pct = len(found_terms) / len(query_terms)
         
@@ -84,7 +86,8 @@ def dynamic_analysis(query, answer, retrieved_chunks):
 
     # 3. Answer Provenance (Hallucination Check)
     if answer:
-        in_context = any(answer.lower() in c[0].text.lower() for c in retrieved_chunks)
+        answer_lower = answer.lower()
+        in_context = any(answer_lower in c[0].text.lower() for c in retrieved_chunks)
         if not in_context:
             insights.append("👻 **Potential Hallucination:** The answer string was NOT found exactly in the retrieved chunks.")
         else:
@@ -107,7 +110,8 @@ import datetime
 def get_rag_system(chunk_size, overlap):
     rag = NaiveRAG()
     docs = load_text_files("data")
-    rag.build_index(docs, chunk_size_words=chunk_size, overlap_words=overlap)
+    # st.cache_resource already keeps built indexes in-process; don't add an on-disk entry per slider combination
+    rag.build_index(docs, chunk_size_words=chunk_size, overlap_words=overlap, cache_dir=None)
     return rag, docs, datetime.datetime.now()
 
 # Sidebar Controls
@@ -1,7 +1,11 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from naive_rag import NaiveRAG, load_text_files, norm_text
 
+# Queries are evaluated concurrently; the embedder's forward pass releases the GIL
+EVAL_WORKERS = 4
+
 def evaluate_system():
     # 1. Setup
     print("🚀 Initializing System...")
@@ -21,14 +25,12 @@ def evaluate_system():
     print(f"{ 'ID':<20} | {'Hit?':<5} | {'Match?':<5} | {'Query':<40}")
     print("-" * 80)
 
-    # 3. Run Loop
-    for item in dataset:
+    def run_one(item, retrieved_chunks):
         query = item["query"]
         gold_substring = item["gold_chunk_substring"]
         expected_answer = item["expected_answer"]
         
-        # Run RAG
-        retrieved_chunks = rag.retrieve(query, top_k=3)
+        # Run RAG (retrieval already done for the whole batch)
         answer, _ = rag.generate_extractive_answer(query, retrieved_chunks)
         
         # --- Metric 1: Retrieval Hit Rate ---
@@ -38,13 +40,22 @@ def evaluate_system():
             if gold_substring in chunk.text:
                 is_hit = True
                 break
-        
-        if is_hit:
-            retrieval_hits += 1
             
         # --- Metric 2: Generation Accuracy (Exact Match) ---
         # Normalize both to ignore capitalization/punctuation
         is_match = norm_text(answer) == norm_text(expected_answer)
+        return is_hit, is_match
+
+    # 3. Run Loop: retrieve all queries in one batch, then generate + score in parallel
+    # (reporting in dataset order)
+    all_retrieved = rag.retrieve_batch([item["query"] for item in dataset], top_k=3)
+    with ThreadPoolExecutor(max_workers=EVAL_WORKERS) as ex:
+        results = list(ex.map(run_one, dataset, all_retrieved))
+
+    for item, (is_hit, is_match) in zip(dataset, results):
+        query = item["query"]
+        if is_hit:
+            retrieval_hits += 1
         if is_match:
             answer_exact_matches += 1
             
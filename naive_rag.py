@@ -1,30 +1,86 @@
 import os
 import json
 import glob
+import hashlib
+import mmap
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Dict, Tuple, Optional, Sequence
 import re
+import threading
 
 import numpy as np
-import faiss
 from sentence_transformers import SentenceTransformer
 from answer_generator import normalize as norm_text, detect_question_type, extract_short_answer
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     doc_id: str
     chunk_id: int
     text: str
 
 
+# Max number of query/answer strings whose embeddings are kept per NaiveRAG instance
+EMBED_CACHE_SIZE = 4096
+
+# Above this many chunks retrieval goes through a FAISS index; below it a plain
+# NumPy matmul is faster and avoids importing faiss at all
+FAISS_MIN_CHUNKS = 50_000
+
+# Built embedding matrices are saved here (next to this module, not the CWD), keyed on
+# the chunk texts + model, and memory-mapped back on later runs instead of re-encoding
+INDEX_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+
+# Least recently used entries beyond this many are deleted after each save
+INDEX_CACHE_MAX_ENTRIES = 8
+
+# Bump whenever the stored layout (dtype, normalization, ...) changes
+INDEX_CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=4)
+def _get_embedder(name: str) -> SentenceTransformer:
+    # One model per process, shared by every NaiveRAG instance (e.g. each Streamlit config)
+    return SentenceTransformer(name)
+
+
+def _read_text(path: str) -> str:
+    # Decode straight from a memory map (served by the OS page cache) instead of
+    # reading the whole file into an intermediate bytes object first
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8")
+    if "\r" in text:
+        # Match text-mode universal newlines
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _prune_index_cache(cache_dir: str, keep: int = INDEX_CACHE_MAX_ENTRIES) -> None:
+    # Entry recency is the metadata file's mtime (touched on every cache hit)
+    metas = glob.glob(os.path.join(cache_dir, "*.json"))
+    if len(metas) <= keep:
+        return
+    metas.sort(key=os.path.getmtime, reverse=True)
+    for meta_path in metas[keep:]:
+        for path in (meta_path, meta_path[: -len(".json")] + ".npy"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
 def load_text_files(folder: str) -> Dict[str, str]:
     files = sorted(glob.glob(os.path.join(folder, "*.*")))
     docs: Dict[str, str] = {}
     for path in files:
         if path.endswith((".txt", ".md")):
-            with open(path, "r", encoding="utf-8") as f:
-                docs[os.path.basename(path)] = f.read()
+            docs[os.path.basename(path)] = _read_text(path)
     if not docs:
         raise FileNotFoundError(f"No .txt/.md files found in folder: {folder}")
     return docs
@@ -34,60 +90,250 @@ def sliding_window_chunk(text: str, chunk_size_words: int = 100, overlap_words:
     words = text.split()
     if not words:
         return []
+    # Join once and slice by word offsets, instead of re-joining every overlapping window
+    joined = " ".join(words)
+    word_starts = [0]
+    word_starts.extend(accumulate(len(w) + 1 for w in words[:-1]))
     chunks = []
     step = max(1, chunk_size_words - overlap_words)
     for start in range(0, len(words), step):
         end = min(len(words), start + chunk_size_words)
-        chunk_words = words[start:end]
-        if len(chunk_words) < max(30, chunk_size_words // 4):
+        if end - start < max(30, chunk_size_words // 4):
             break
-        chunks.append(" ".join(chunk_words))
+        chunks.append(joined[word_starts[start]:word_starts[end - 1] + len(words[end - 1])])
         if end >= len(words):
             break
     return chunks
 
 
+class _ChunkView(Sequence):
+    # Read-only, indexable view over NaiveRAG's parallel chunk arrays; builds one Chunk per access
+    def __init__(self, rag: "NaiveRAG"):
+        self._rag = rag
+
+    def __len__(self) -> int:
+        return len(self._rag.texts)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._rag._chunk(i) for i in range(*idx.indices(len(self)))]
+        n = len(self)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("chunk index out of range")
+        return self._rag._chunk(idx)
+
+
 class NaiveRAG:
     def __init__(self, embedding_model: str = "all-MiniLM-L6-v2"):
-        self.embedder = SentenceTransformer(embedding_model)
+        self.embedding_model = embedding_model
+        self.embedder = _get_embedder(embedding_model)
         self.index = None
-        self.chunks: List[Chunk] = []
+        self.embs: Optional[np.ndarray] = None
+        # Chunk store as parallel arrays; Chunk objects are only built on demand
+        self.texts: List[str] = []
+        self.doc_ids: List[str] = []
+        self.chunk_ids: np.ndarray = np.empty(0, dtype=np.int32)
         self.dim = None
+        self._chunks_view = _ChunkView(self)
+        self._embed_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embed_lock = threading.Lock()  # retrieve/generate may run from worker threads
+
+    def _cache_embedding(self, text: str, vec: np.ndarray) -> np.ndarray:
+        vec.setflags(write=False)  # shared between callers
+        with self._embed_lock:
+            self._embed_cache[text] = vec
+            if len(self._embed_cache) > EMBED_CACHE_SIZE:
+                self._embed_cache.popitem(last=False)
+        return vec
+
+    def _encode(self, texts: List[str], **kwargs) -> np.ndarray:
+        # Normalized embeddings as contiguous FP32; encode already returns that, so the cast is a no-op
+        embs = self.embedder.encode(texts, normalize_embeddings=True, convert_to_numpy=True, **kwargs)
+        return np.ascontiguousarray(embs, dtype=np.float32)
+
+    def _cached_embedding(self, text: str) -> Optional[np.ndarray]:
+        # All reads of the embedding cache go through the lock
+        with self._embed_lock:
+            vec = self._embed_cache.get(text)
+            if vec is not None:
+                self._embed_cache.move_to_end(text)
+            return vec
+
+    def _embed_text(self, text: str) -> np.ndarray:
+        # Normalized FP32 embedding of a single string, LRU-cached per instance
+        vec = self._cached_embedding(text)
+        if vec is not None:
+            return vec
+        return self._cache_embedding(text, self._encode([text])[0])
+
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        # Like _embed_text for many strings: cache misses are encoded together in one batch
+        cached = {}
+        with self._embed_lock:
+            for t in texts:
+                vec = self._embed_cache.get(t)
+                if vec is not None:
+                    # Refresh recency exactly as _cached_embedding does, so hits here aren't evicted first
+                    self._embed_cache.move_to_end(t)
+                    cached[t] = vec
+        missing = list(dict.fromkeys(t for t in texts if t not in cached))
+        if missing:
+            embs = self._encode(missing, batch_size=64)
+            for t, vec in zip(missing, embs):
+                cached[t] = self._cache_embedding(t, vec)
+        return np.stack([cached[t] for t in texts])
+
+    def _chunk(self, idx: int) -> Chunk:
+        # Called per retrieved hit, so only copy stored fields here; derive nothing
+        return Chunk(
+            doc_id=self.doc_ids[idx],
+            chunk_id=int(self.chunk_ids[idx]),
+            text=self.texts[idx],
+        )
 
-    def build_index(self, docs: Dict[str, str], chunk_size_words: int = 100, overlap_words: int = 20):
-        all_chunks: List[Chunk] = []
+    @property
+    def chunks(self) -> Sequence[Chunk]:
+        return self._chunks_view
+
+    def _index_key(self, texts: List[str]) -> str:
+        # Keyed on exactly what the vectors depend on: the chunk texts (so chunker changes
+        # invalidate), the model, and the on-disk format version
+        h = hashlib.blake2b(digest_size=8)
+        h.update(f"v{INDEX_CACHE_VERSION}\0{self.embedding_model}\0{len(texts)}\0".encode("utf-8"))
+        for text in texts:
+            data = text.encode("utf-8")
+            h.update(f"{len(data)}\0".encode("utf-8"))
+            h.update(data)
+        return h.hexdigest()
+
+    def _load_cached_index(self, cache_dir: str, key: str, num_chunks: int) -> Optional[np.ndarray]:
+        emb_path = os.path.join(cache_dir, f"{key}.npy")
+        meta_path = os.path.join(cache_dir, f"{key}.json")
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            embs = np.load(emb_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if (
+            meta.get("version") != INDEX_CACHE_VERSION
+            or meta.get("model") != self.embedding_model
+            or embs.dtype != np.float32
+            or embs.shape != (num_chunks, meta.get("dim"))
+        ):
+            return None
+        try:
+            os.utime(meta_path)  # mark as recently used for _prune_index_cache
+        except OSError:
+            pass
+        return embs
+
+    def _save_cached_index(self, cache_dir: str, key: str, embs: np.ndarray, meta: Dict) -> None:
+        # Best effort: a read-only or full disk just means the next run re-encodes
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            emb_path = os.path.join(cache_dir, f"{key}.npy")
+            meta_path = os.path.join(cache_dir, f"{key}.json")
+            with open(emb_path + ".tmp", "wb") as f:
+                np.save(f, embs)
+            os.replace(emb_path + ".tmp", emb_path)
+            # Metadata is written last, so its presence marks a complete entry
+            with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(meta_path + ".tmp", meta_path)
+            _prune_index_cache(cache_dir)
+        except OSError:
+            pass
+
+    def build_index(
+        self,
+        docs: Dict[str, str],
+        chunk_size_words: int = 100,
+        overlap_words: int = 20,
+        cache_dir: Optional[str] = INDEX_CACHE_DIR,
+    ):
+        texts: List[str] = []
+        doc_ids: List[str] = []
+        chunk_ids: List[int] = []
         for doc_id, text in docs.items():
             pieces = sliding_window_chunk(text, chunk_size_words, overlap_words)
-            for i, chunk_text in enumerate(pieces):
-                all_chunks.append(Chunk(doc_id=doc_id, chunk_id=i, text=chunk_text))
+            texts.extend(pieces)
+            doc_ids.extend([doc_id] * len(pieces))
+            chunk_ids.extend(range(len(pieces)))
 
-        if not all_chunks:
+        if not texts:
             raise ValueError("No chunks created. Check your documents / chunking params.")
 
-        self.chunks = all_chunks
-
-        texts = [c.text for c in self.chunks]
-        embs = self.embedder.encode(texts, normalize_embeddings=True, show_progress_bar=True)
-        embs = np.asarray(embs, dtype=np.float32)
+        self.texts = texts
+        self.doc_ids = doc_ids
+        self.chunk_ids = np.asarray(chunk_ids, dtype=np.int32)
+
+        embs = None
+        if cache_dir is not None:
+            key = self._index_key(texts)
+            embs = self._load_cached_index(cache_dir, key, len(texts))
+        if embs is None:
+            embs = self._encode(texts, show_progress_bar=True)
+            if cache_dir is not None:
+                meta = {
+                    "version": INDEX_CACHE_VERSION,
+                    "model": self.embedding_model,
+                    "chunk_size_words": chunk_size_words,
+                    "overlap_words": overlap_words,
+                    "num_chunks": len(texts),
+                    "dim": int(embs.shape[1]),
+                }
+                self._save_cached_index(cache_dir, key, embs, meta)
 
         self.dim = embs.shape[1]
-        self.index = faiss.IndexFlatIP(self.dim)  # cosine via inner product because normalized
-        self.index.add(embs)
+        self.index = None
+        if len(embs) > FAISS_MIN_CHUNKS:
+            import faiss
 
-    def retrieve(self, query: str, top_k: int = 6) -> List[Tuple[Chunk, float]]:
-        if self.index is None:
-            raise RuntimeError("Index not built. Call build_index() first.")
+            self.index = faiss.IndexFlatIP(self.dim)  # cosine via inner product because normalized
+            self.index.add(np.ascontiguousarray(embs))
+        self.embs = embs
 
-        q_emb = self.embedder.encode([query], normalize_embeddings=True)
-        q_emb = np.asarray(q_emb, dtype=np.float32)
+    def _scores(self, q: np.ndarray) -> np.ndarray:
+        # Inner product of every chunk with q (a vector, or a [D, nq] matrix of queries);
+        # one SGEMV/SGEMM straight over the stored FP32 matrix, no per-query conversion
+        return self.embs @ q
 
-        scores, ids = self.index.search(q_emb, top_k)
-        results: List[Tuple[Chunk, float]] = []
-        for idx, score in zip(ids[0], scores[0]):
-            if idx == -1:
-                continue
-            results.append((self.chunks[idx], float(score)))
-        return results
+    def retrieve(self, query: str, top_k: int = 6) -> List[Tuple[Chunk, float]]:
+        return self.retrieve_batch([query], top_k=top_k)[0]
+
+    def retrieve_batch(self, queries: List[str], top_k: int = 6) -> List[List[Tuple[Chunk, float]]]:
+        if self.embs is None:
+            raise RuntimeError("Index not built. Call build_index() first.")
+        if not queries:
+            return []
+
+        Q = self._embed_texts(queries)
+
+        if self.index is not None:
+            scores, ids = self.index.search(Q, top_k)
+        else:
+            # Exhaustive inner product (cosine, since normalized) as one GEMM + row-wise partial sort
+            all_scores = self._scores(Q.T).T
+            k = min(top_k, all_scores.shape[1])
+            if k <= 0:
+                return [[] for _ in queries]
+            ids = np.argpartition(-all_scores, k - 1, axis=1)[:, :k]
+            order = np.argsort(-np.take_along_axis(all_scores, ids, axis=1), axis=1, kind="stable")
+            ids = np.take_along_axis(ids, order, axis=1)
+            scores = np.take_along_axis(all_scores, ids, axis=1)
+
+        batch: List[List[Tuple[Chunk, float]]] = []
+        for row_ids, row_scores in zip(ids, scores):
+            results: List[Tuple[Chunk, float]] = []
+            for idx, score in zip(row_ids, row_scores):
+                if idx == -1:
+                    continue
+                results.append((self._chunk(idx), float(score)))
+            batch.append(results)
+        return batch
 
     def _split_sentences(self, text: str) -> List[str]:
         # Split on newlines to handle headers that lack punctuation
@@ -112,12 +358,19 @@ class NaiveRAG:
         sentences = self._split_sentences(text)
         if not sentences:
             return text.strip()
-        q_emb = self.embedder.encode([query], normalize_embeddings=True)
-        s_embs = self.embedder.encode(sentences, normalize_embeddings=True)
-        q = np.asarray(q_emb, dtype=np.float32)[0]
-        S = np.asarray(s_embs, dtype=np.float32)
-        sims = S @ q
-        best_idx = int(np.argmax(sims))
+        if len(sentences) == 1:
+            # Nothing to rank; skip the encode entirely
+            return sentences[0]
+        q = self._cached_embedding(query)
+        if q is None:
+            # Encode query and sentences in one batch (one forward pass instead of two)
+            embs = self._encode([query] + sentences)
+            # Copy the query row so the cache doesn't keep the sentence embeddings alive
+            q = self._cache_embedding(query, embs[0].copy())
+            S = embs[1:]
+        else:
+            S = self._encode(sentences)
+        best_idx = int(np.argmax(S @ q))
         return sentences[best_idx]
 
     def generate_extractive_answer(
@@ -201,11 +454,9 @@ def run_case_study_txt(
 
         expected = t["expected"].strip()
         em = norm_text(answer) == norm_text(expected)
-        ans_emb = rag.embedder.encode([answer], normalize_embeddings=True)
-        exp_emb = rag.embedder.encode([expected], normalize_embeddings=True)
         # Robust cosine: embeddings are normalized, so dot product equals cosine.
-        ans_vec = np.asarray(ans_emb, dtype=np.float32).reshape(-1)
-        exp_vec = np.asarray(exp_emb, dtype=np.float32).reshape(-1)
+        ans_vec = rag._embed_text(answer)
+        exp_vec = rag._embed_text(expected)
         cosine = float(np.dot(ans_vec, exp_vec))
 
         record = {